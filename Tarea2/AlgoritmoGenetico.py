@@ -14,9 +14,17 @@
 #
 # Licencia: MIT
 # -----------------------------------------------------------------------------
-import csv
+import functools
+import importlib.util
 import math
-import random
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+
+# Numba es opcional: sin él se usa la versión de NumPy. Se importa sólo cuando
+# hace falta (ver `_aptitud_kernel`), ya que cargarlo tarda más que una corrida
+# completa con las poblaciones pequeñas del problema.
+NUMBA_DISPONIBLE = importlib.util.find_spec("numba") is not None
 
 
 # -----------------------------------------------------------------------------
@@ -27,7 +35,26 @@ import random
 #
 #    - 10 bits para x
 #    - 10 bits para y
+#
+# El cromosoma completo se empaqueta en un único entero sin signo de 32 bits:
+# los n_bits más significativos corresponden a x y los n_bits menos
+# significativos a y, respetando el orden de lectura de la cadena binaria.
 # -----------------------------------------------------------------------------
+@functools.cache
+def pesos_binarios(n_bits: int) -> np.ndarray:
+    """
+    Potencias de dos [2^(n_bits-1), ..., 2, 1] para decodificar por producto
+    punto. Se calculan una sola vez por longitud y se reutilizan.
+
+    Se usa el entero sin signo más pequeño que contiene 2^n_bits - 1: el
+    producto nunca desborda y, con cromosomas uint8, es más rápido que int64.
+    """
+    tipo = np.min_scalar_type((1 << n_bits) - 1)
+    pesos = (1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64)).astype(tipo)
+    pesos.flags.writeable = False
+    return pesos
+
+
 def codificar(x: float, a: float, b: float, bits: int = 10) -> list[int]:
     if a >= b:
         raise ValueError("El límite inferior debe ser menor que el límite superior.")
@@ -47,21 +74,71 @@ def codificar(x: float, a: float, b: float, bits: int = 10) -> list[int]:
     return n_bits
 
 
-def decodificar(bits: list[int], a: float, b: float) -> float:
+def decodificar(bits: np.ndarray | list[int], a: float, b: float) -> float | np.ndarray:
+    """
+    Decodifica un cromosoma (arreglo 1D) o un bloque de cromosomas (arreglo 2D
+    de forma (N, n_bits)) al intervalo [a, b]. En el caso 2D se decodifica
+    toda la población de una sola vez.
+    """
     if a >= b:
         raise ValueError("El límite inferior debe ser menor que el límite superior.")
 
-    n_bits = len(bits)
+    # Admite también listas de bits, como las que devuelve `codificar`
+    bits = np.asarray(bits)
+    n_bits = bits.shape[-1]
+
     max_int = (1 << n_bits) - 1
 
-    k = 0
-    for bit in bits:
-        k = (k << 1) | (bit & 1)
+    # k = sum_i bit_i * 2^(n_bits - 1 - i)  (el primer bit es el más significativo)
+    k = bits @ pesos_binarios(n_bits)
 
-    x = a + (k / max_int) * (b - a)
+    x = a + k * ((b - a) / max_int)
     return x
 
 
+def decodificar_entero(
+    k: int | np.ndarray, a: float, b: float, n_bits: int = 10
+) -> float | np.ndarray:
+    """
+    Escala el entero k en [0, 2^n_bits - 1] (o un arreglo de ellos) al
+    intervalo [a, b].
+    """
+    if a >= b:
+        raise ValueError("El límite inferior debe ser menor que el límite superior.")
+
+    max_int = (1 << n_bits) - 1
+    return a + k * ((b - a) / max_int)
+
+
+def decodificar_cromosoma(
+    cromosoma: int | np.ndarray,
+    a_x: float,
+    b_x: float,
+    a_y: float,
+    b_y: float,
+    n_bits: int = 10,
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    Extrae (x, y) de uno o varios cromosomas empaquetados: x ocupa los n_bits
+    altos y y los n_bits bajos.
+    """
+    mascara = (1 << n_bits) - 1
+    k_x = (cromosoma >> n_bits) & mascara
+    k_y = cromosoma & mascara
+    x = decodificar_entero(k_x, a_x, b_x, n_bits)
+    y = decodificar_entero(k_y, a_y, b_y, n_bits)
+    return x, y
+
+
+def desempaquetar(cromosoma: int, longitud: int = 20) -> list[int]:
+    """
+    Devuelve la lista de bits del cromosoma empaquetado, del más significativo
+    al menos significativo.
+    """
+    cromosoma = int(cromosoma)
+    return [(cromosoma >> i) & 1 for i in range(longitud - 1, -1, -1)]
+
+
 # -----------------------------------------------------------------------------
 # 2. Definición de la función de aptitud
 #
@@ -69,15 +146,55 @@ def decodificar(bits: list[int], a: float, b: float) -> float:
 #
 #        aptitud(x, y) = -f(x, y)
 #
+# `f_objetivo` evalúa un único punto; `f_objetivo_vec` evalúa arreglos de x e y
+# (uno por individuo) en una sola operación vectorizada de NumPy.
 # -----------------------------------------------------------------------------
+TWO_PI = 2.0 * math.pi
+_cos = math.cos  # enlace directo: evita buscar `math.cos` en cada llamada
+
+
 def f_objetivo(x: float, y: float) -> float:
-    return 20 + x**2 + y**2 - math.cos(2 * math.pi * x) + math.cos(2 * math.pi * y)
+    return 20.0 + x * x + y * y - _cos(TWO_PI * x) + _cos(TWO_PI * y)
+
+
+def f_objetivo_vec(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return 20.0 + x * x + y * y - np.cos(TWO_PI * x) + np.cos(TWO_PI * y)
 
 
 def aptitud(x: float, y: float) -> float:
     return -f_objetivo(x, y)
 
 
+def aptitud_punto(punto: tuple[float, float]) -> float:
+    # Versión de un solo argumento, para usarse con `map_fn` (ver evaluar_poblacion)
+    return aptitud(*punto)
+
+
+# Por debajo de este tamaño de población la versión de NumPy es más rápida que
+# repartir el trabajo entre hilos con Numba.
+UMBRAL_JIT = 10_000
+
+
+@functools.cache
+def _aptitud_kernel() -> Callable:
+    # Importa Numba y compila el kernel la primera vez que se necesita.
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(x, y, salida):
+        # Compilado a código nativo: escribe -f(x_i, y_i) en `salida`.
+        for i in prange(x.size):
+            salida[i] = -(
+                20.0
+                + x[i] * x[i]
+                + y[i] * y[i]
+                - math.cos(TWO_PI * x[i])
+                + math.cos(TWO_PI * y[i])
+            )
+
+    return kernel
+
+
 # -----------------------------------------------------------------------------
 # 3. Generación de la población inicial
 #
@@ -86,13 +203,31 @@ def aptitud(x: float, y: float) -> float:
 # Cada cromosoma corresponde a un individuo y está compuesto por 20 bits:
 #    - 10 bits asignados a la variable x
 #    - 10 bits asignados a la variable y
+#
+# La población completa se almacena como un arreglo de NumPy de forma
+# (tamano,) y tipo uint32: cada elemento es un cromosoma empaquetado, por lo que
+# 2 * n_bits no puede exceder 32.
+#
+# Todas las funciones aleatorias reciben un generador `rng` (np.random.Generator);
+# si se omite se crea uno nuevo sin semilla.
 # -----------------------------------------------------------------------------
-def cromosoma_aleatorio(n_bits: int = 10) -> list[int]:
-    return [random.randint(0, 1) for _ in range(2 * n_bits)]
-
+def cromosoma_aleatorio(
+    n_bits: int = 10, rng: np.random.Generator | None = None
+) -> int:
+    rng = np.random.default_rng(rng)
+    return int(rng.integers(0, 1 << (2 * n_bits)))
+
+
+def poblacion_inicial(
+    tamano: int, n_bits: int = 10, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    if 2 * n_bits > 32:
+        raise ValueError(
+            "El cromosoma empaquetado admite a lo sumo 16 bits por variable."
+        )
 
-def poblacion_inicial(tamano: int, n_bits: int = 10) -> list[list[int]]:
-    return [cromosoma_aleatorio(n_bits) for _ in range(tamano)]
+    rng = np.random.default_rng(rng)
+    return rng.integers(0, 1 << (2 * n_bits), size=tamano, dtype=np.uint32)
 
 
 # -----------------------------------------------------------------------------
@@ -118,93 +253,160 @@ def poblacion_inicial(tamano: int, n_bits: int = 10) -> list[list[int]]:
 #         óptimos locales.
 # -----------------------------------------------------------------------------
 def evaluar_poblacion(
-    poblacion: list[list[int]],
+    poblacion: np.ndarray,
     a_x: float,
     b_x: float,
     a_y: float,
     b_y: float,
     n_bits: int = 10,
-) -> list[float]:
-    aptitudes = []
-    for individuo in poblacion:
-        bits_x = individuo[:n_bits]
-        bits_y = individuo[n_bits : 2 * n_bits]
-        x = decodificar(bits_x, a_x, b_x)
-        y = decodificar(bits_y, a_y, b_y)
-        aptitudes.append(aptitud(x, y))
-    return aptitudes
+    salida: np.ndarray | None = None,
+    map_fn: Callable[[Callable, Iterable], Iterator] | None = None,
+) -> np.ndarray:
+    """
+    Calcula la aptitud de toda la población.
+
+    Por defecto la evaluación es vectorizada, o compilada con Numba para
+    poblaciones de al menos `UMBRAL_JIT` individuos. Si se proporciona
+    `map_fn` (por ejemplo `map`, `multiprocessing.Pool.map` o
+    `ProcessPoolExecutor.map`), la aptitud se evalúa individuo por individuo
+    como `map_fn(aptitud_punto, puntos)`, lo que permite repartir una función
+    objetivo costosa entre varios procesos. En ese caso la función evaluada
+    debe estar definida a nivel de módulo para poder serializarse (pickle).
+
+    Los procesos deben crearse con el contexto "spawn", no con "fork" (el
+    predeterminado en Linux): si el kernel de Numba ya se ejecutó, su conjunto
+    de hilos no sobrevive a un fork y el intérprete puede no terminar nunca.
+    Por ejemplo:
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(mp_context=ctx) as ex:
+            evaluar_poblacion(..., map_fn=ex.map)
+    """
+    x, y = decodificar_cromosoma(poblacion, a_x, b_x, a_y, b_y, n_bits)
+
+    # `salida` permite reutilizar el mismo arreglo de aptitudes entre generaciones.
+    if salida is None:
+        salida = np.empty(len(poblacion))
+
+    if map_fn is not None:
+        puntos = zip(x.tolist(), y.tolist())
+        salida[:] = list(map_fn(aptitud_punto, puntos))
+    elif NUMBA_DISPONIBLE and len(poblacion) >= UMBRAL_JIT:
+        _aptitud_kernel()(x, y, salida)
+    else:
+        np.negative(f_objetivo_vec(x, y), out=salida)
+    return salida
 
 
 def seleccion_torneo(
-    poblacion: list[list[int]],
-    aptitudes: list[float],
+    poblacion: np.ndarray,
+    aptitudes: np.ndarray,
     tamano_torneo: int = 3,
-) -> list[list[int]]:
-    nueva_poblacion = []
+    rng: np.random.Generator | None = None,
+    salida: np.ndarray | None = None,
+) -> np.ndarray:
+    rng = np.random.default_rng(rng)
     n = len(poblacion)
-    for _ in range(n):
-        indices = [random.randint(0, n - 1) for _ in range(tamano_torneo)]
-        mejor_indice = max(indices, key=lambda i: aptitudes[i])
-        nueva_poblacion.append(poblacion[mejor_indice][:])
-    return nueva_poblacion
+
+    # Los n torneos se sortean de una sola vez: cada fila de `indices` son los
+    # competidores de un torneo y el ganador es el de mayor aptitud en la fila.
+    indices = rng.integers(0, n, size=(n, tamano_torneo))
+    ganadores = indices[np.arange(n), aptitudes[indices].argmax(axis=1)]
+
+    # `salida` (distinto de `poblacion`) permite escribir en un búfer
+    # preasignado. Los índices siempre son válidos; con mode="clip" `np.take`
+    # escribe directo en `salida` en vez de pasar por un arreglo temporal.
+    return np.take(poblacion, ganadores, out=salida, mode="clip")
 
 
 def cruce_un_punto(
-    padre1: list[int],
-    padre2: list[int],
+    padre1: int,
+    padre2: int,
     probabilidad_cruce: float = 0.7,
-) -> tuple[list[int], list[int]]:
-    if len(padre1) != len(padre2):
-        raise ValueError("Los padres deben tener la misma longitud.")
-
-    n = len(padre1)
+    n_bits: int = 10,
+    rng: np.random.Generator | None = None,
+) -> tuple[int, int]:
+    rng = np.random.default_rng(rng)
+    n = 2 * n_bits
 
-    if random.random() >= probabilidad_cruce:
+    if rng.random() >= probabilidad_cruce:
         return padre1, padre2
 
-    punto_cruce = random.randint(1, n - 1)
-    hijo1 = padre1[:punto_cruce] + padre2[punto_cruce:]
-    hijo2 = padre2[:punto_cruce] + padre1[punto_cruce:]
+    # Los bits a la derecha del punto de cruce (los n - punto menos
+    # significativos) se intercambian entre los padres.
+    punto_cruce = int(rng.integers(1, n))
+    # Máscara y complemento sin enteros negativos: así la operación también vale
+    # con padres np.uint32 tomados directamente de la población.
+    mascara = (1 << (n - punto_cruce)) - 1
+    alta = ((1 << n) - 1) ^ mascara
+    hijo1 = (padre1 & alta) | (padre2 & mascara)
+    hijo2 = (padre2 & alta) | (padre1 & mascara)
 
     return hijo1, hijo2
 
 
 def aplicar_cruce_poblacion(
-    poblacion: list[list[int]],
+    poblacion: np.ndarray,
     probabilidad_cruce: float = 0.7,
-) -> list[list[int]]:
-    nueva: list[list[int]] = []
-    n = len(poblacion)
+    n_bits: int = 10,
+    rng: np.random.Generator | None = None,
+    salida: np.ndarray | None = None,
+) -> np.ndarray:
+    rng = np.random.default_rng(rng)
+    n = 2 * n_bits
+    n_pares = len(poblacion) // 2
+
+    # `salida` puede ser la propia `poblacion` (cruce en el mismo búfer)
+    if salida is None:
+        salida = np.empty_like(poblacion)
+    if salida is not poblacion and len(poblacion) % 2 == 1:
+        salida[-1] = poblacion[-1]
 
-    for i in range(0, n - 1, 2):
-        padre1 = poblacion[i]
-        padre2 = poblacion[i + 1]
-        hijo1, hijo2 = cruce_un_punto(padre1, padre2, probabilidad_cruce)
-        nueva.extend([hijo1, hijo2])
+    padres1 = poblacion[0 : 2 * n_pares : 2]
+    padres2 = poblacion[1 : 2 * n_pares : 2]
 
-    if n % 2 == 1:
-        nueva.append(poblacion[-1][:])
+    # Un punto de cruce y una decisión de cruce por pareja; las parejas que no
+    # se cruzan reciben una máscara vacía y se copian sin cambios.
+    cruza = rng.random(n_pares) < probabilidad_cruce
+    puntos = rng.integers(1, n, size=n_pares)
+    mascaras = (np.uint32(1) << (n - puntos).astype(np.uint32)) - np.uint32(1)
+    mascaras *= cruza
 
-    return nueva
+    # Intercambio sin ramas: los bits que difieren bajo la máscara se invierten.
+    diferencias = (padres1 ^ padres2) & mascaras
+    np.bitwise_xor(padres1, diferencias, out=salida[0 : 2 * n_pares : 2])
+    np.bitwise_xor(padres2, diferencias, out=salida[1 : 2 * n_pares : 2])
+
+    return salida
 
 
 def mutar_cromosoma(
-    cromosoma: list[int], probabilidad_mutacion: float = 0.01
-) -> list[int]:
-    nuevo_cromosoma: list[int] = []
-    for bit in cromosoma:
-        if random.random() < probabilidad_mutacion:
-            nuevo_cromosoma.append(1 - bit)  # flip
-        else:
-            nuevo_cromosoma.append(bit)
-    return nuevo_cromosoma
+    cromosoma: int,
+    probabilidad_mutacion: float = 0.01,
+    n_bits: int = 10,
+    rng: np.random.Generator | None = None,
+) -> int:
+    rng = np.random.default_rng(rng)
+    n = 2 * n_bits
+    mascara = int((rng.random(n) < probabilidad_mutacion) @ pesos_binarios(n))
+    return cromosoma ^ mascara  # flip
 
 
 def aplicar_mutacion_poblacion(
-    poblacion: list[list[int]],
+    poblacion: np.ndarray,
     probabilidad_mutacion: float = 0.01,
-) -> list[list[int]]:
-    return [mutar_cromosoma(ind, probabilidad_mutacion) for ind in poblacion]
+    n_bits: int = 10,
+    rng: np.random.Generator | None = None,
+    salida: np.ndarray | None = None,
+) -> np.ndarray:
+    rng = np.random.default_rng(rng)
+    n = 2 * n_bits
+
+    # Una máscara de bits a invertir por individuo, empaquetada en uint32.
+    # `salida` puede ser la propia `poblacion` (mutación en el mismo búfer).
+    sorteos = rng.random((len(poblacion), n)) < probabilidad_mutacion
+    mascaras = (sorteos @ pesos_binarios(n)).astype(np.uint32)
+    return np.bitwise_xor(poblacion, mascaras, out=salida)
 
 
 # -----------------------------------------------------------------------------
@@ -225,14 +427,32 @@ def aplicar_mutacion_poblacion(
 #           - Mutación: se modifican aleatoriamente bits de los cromosomas con
 #             baja probabilidad, manteniendo la diversidad genética.
 #
-#    4) Iteración:
+#    4) Elitismo:
+#           - El mejor individuo encontrado hasta el momento (élite) se copia
+#             sin cambios a la siguiente generación, de modo que la mejor
+#             aptitud nunca empeora.
+#
+#    5) Iteración:
 #           - Los pasos de evaluación y aplicación de operadores se repiten
 #             durante un número fijo de generaciones, permitiendo que la
 #             población evolucione hacia soluciones con mejor aptitud.
 #
-# Al finalizar el bucle, se selecciona el mejor individuo encontrado y se
-# reporta su ubicación en el espacio (x, y) junto con el valor de f(x, y).
+# Al finalizar el bucle, se reporta la élite: su ubicación en el espacio (x, y)
+# junto con el valor de f(x, y).
+#
+# El historial de la evolución se acumula en un arreglo estructurado
+# preasignado (una fila por generación) y se escribe al CSV de una sola vez.
 # -----------------------------------------------------------------------------
+HISTORIAL_DTYPE = np.dtype(
+    [
+        ("generacion", "i4"),
+        ("mejor_aptitud", "f8"),
+        ("aptitud_promedio", "f8"),
+        ("mejor_x", "f8"),
+        ("mejor_y", "f8"),
+        ("f_mejor", "f8"),
+    ]
+)
 
 
 def algoritmo_genetico(
@@ -246,16 +466,23 @@ def algoritmo_genetico(
     probabilidad_cruce: float = 0.7,
     probabilidad_mutacion: float = 0.01,
     ruta_csv: str | None = "algoritmo_genetico_historial.csv",
-) -> tuple[list[int], float, float, float]:
+    map_fn: Callable[[Callable, Iterable], Iterator] | None = None,
+    semilla: int | None = None,
+    verbose: bool = False,
+    log_every: int = 1,
+) -> tuple[int, float, float, float]:
     """
     Ejecuta un algoritmo genético (AG) para minimizar la función objetivo
     f(x, y) = 20 + x^2 + y^2 - cos(2πx) + cos(2πy), donde las variables x e y
     están acotadas dentro del intervalo [-5.12, 5.12].
 
     El AG utiliza una representación binaria mediante cromosomas de 2*n_bits bits:
-    n_bits para x y n_bits para y. La minimización se implementa definiendo
+    n_bits para x y n_bits para y. La población se almacena como un arreglo
+    uint32 de forma (tamano_poblacion,), con cada cromosoma empaquetado en un
+    entero. La minimización se implementa definiendo
     la aptitud como el negativo de la función objetivo, de modo que el
-    algoritmo opera bajo un esquema de maximización tradicional.
+    algoritmo opera bajo un esquema de maximización tradicional. El mejor
+    individuo encontrado se conserva entre generaciones (elitismo).
 
     Parámetros:
         generaciones (int):
@@ -275,91 +502,215 @@ def algoritmo_genetico(
         ruta_csv (str | None):
             Ruta del archivo CSV donde se registrará la evolución del AG.
             Si es None, no se guarda archivo.
+        map_fn (Callable | None):
+            Función tipo `map` para evaluar la aptitud en paralelo (esquema
+            maestro/esclavo), p. ej. `ProcessPoolExecutor(mp_context=ctx).map`
+            con `ctx = multiprocessing.get_context("spawn")` (ver
+            `evaluar_poblacion`). Si es None se usa la evaluación vectorizada.
+        semilla (int | None):
+            Semilla del generador aleatorio (PCG64) que comparten todos los
+            operadores. Si es None, cada ejecución es distinta.
+        verbose (bool):
+            Si es True, imprime el progreso en consola.
+        log_every (int):
+            Con `verbose`, imprime sólo una de cada `log_every` generaciones.
 
     Retorna:
         (mejor_cromosoma, mejor_x, mejor_y, mejor_f):
-            - mejor_cromosoma (list[int]): Cromosoma binario del mejor individuo.
+            - mejor_cromosoma (int): Cromosoma empaquetado del mejor individuo.
             - mejor_x (float): Valor de x decodificado a partir del cromosoma.
             - mejor_y (float): Valor de y decodificado a partir del cromosoma.
             - mejor_f (float): Valor mínimo aproximado de la función objetivo.
     """
-    poblacion = poblacion_inicial(tamano_poblacion, n_bits)
+    rng = np.random.default_rng(semilla)
 
-    historial: list[dict] = []
+    # Dos búferes de población que se alternan entre generaciones: la
+    # selección lee de `actual` y escribe en `siguiente`; el cruce y la
+    # mutación trabajan sobre `siguiente` en el mismo lugar. Sólo se reutilizan
+    # la población y las aptitudes: los sorteos y máscaras de los operadores
+    # se siguen creando en cada generación.
+    buferes = np.empty((2, tamano_poblacion), dtype=np.uint32)
+    actual, siguiente = 0, 1
+    buferes[actual] = poblacion_inicial(tamano_poblacion, n_bits, rng)
+
+    historial = np.empty(generaciones, dtype=HISTORIAL_DTYPE)
+    aptitudes = np.empty(tamano_poblacion)
+
+    # Élite: mejor individuo visto hasta ahora
+    elite_crom, elite_aptitud = 0, -np.inf
 
     for gen in range(generaciones):
+        poblacion = buferes[actual]
+
         # Evaluación
-        aptitudes = evaluar_poblacion(poblacion, a_x, b_x, a_y, b_y, n_bits)
+        evaluar_poblacion(
+            poblacion, a_x, b_x, a_y, b_y, n_bits, salida=aptitudes, map_fn=map_fn
+        )
 
         # Métricas de la generación
-        mejor_aptitud = max(aptitudes)
-        promedio_aptitud = sum(aptitudes) / len(aptitudes)
-        idx_mejor = max(range(len(poblacion)), key=lambda i: aptitudes[i])
-        crom_mejor_gen = poblacion[idx_mejor]
-
-        bits_x_gen = crom_mejor_gen[:n_bits]
-        bits_y_gen = crom_mejor_gen[n_bits : 2 * n_bits]
-        x_gen = decodificar(bits_x_gen, a_x, b_x)
-        y_gen = decodificar(bits_y_gen, a_y, b_y)
+        idx_mejor = int(aptitudes.argmax())
+        mejor_aptitud = float(aptitudes[idx_mejor])
+        promedio_aptitud = float(aptitudes.mean())
+        crom_mejor_gen = int(poblacion[idx_mejor])
+
+        if mejor_aptitud > elite_aptitud:
+            elite_crom, elite_aptitud = crom_mejor_gen, mejor_aptitud
+
+        x_gen, y_gen = decodificar_cromosoma(crom_mejor_gen, a_x, b_x, a_y, b_y, n_bits)
         f_gen = f_objetivo(x_gen, y_gen)
 
         # Registro (para CSV / gráficas)
-        historial.append(
-            {
-                "generacion": gen + 1,
-                "mejor_aptitud": mejor_aptitud,
-                "aptitud_promedio": promedio_aptitud,
-                "mejor_x": x_gen,
-                "mejor_y": y_gen,
-                "f_mejor": f_gen,
-            }
+        historial[gen] = (
+            gen + 1,
+            mejor_aptitud,
+            promedio_aptitud,
+            x_gen,
+            y_gen,
+            f_gen,
         )
 
         # (Opcional) imprimir en consola
-        print(
-            f"Generación {gen + 1:3d}: "
-            f"Mejor aptitud = {mejor_aptitud:.6f}, "
-            f"Aptitud promedio = {promedio_aptitud:.6f}"
-        )
+        if verbose and gen % log_every == 0:
+            print(
+                f"Generación {gen + 1:3d}: "
+                f"Mejor aptitud = {mejor_aptitud:.6f}, "
+                f"Aptitud promedio = {promedio_aptitud:.6f}"
+            )
 
         # Selección, cruce y mutación
-        poblacion = seleccion_torneo(poblacion, aptitudes, tamano_torneo=3)
-        poblacion = aplicar_cruce_poblacion(poblacion, probabilidad_cruce)
-        poblacion = aplicar_mutacion_poblacion(poblacion, probabilidad_mutacion)
-
-    # Evaluación final
-    aptitudes_finales = evaluar_poblacion(poblacion, a_x, b_x, a_y, b_y, n_bits)
-    mejor_indice = max(range(len(poblacion)), key=lambda i: aptitudes_finales[i])
-    mejor_cromosoma = poblacion[mejor_indice]
-
-    bits_x = mejor_cromosoma[:n_bits]
-    bits_y = mejor_cromosoma[n_bits : 2 * n_bits]
-    mejor_x = decodificar(bits_x, a_x, b_x)
-    mejor_y = decodificar(bits_y, a_y, b_y)
+        nueva = buferes[siguiente]
+        seleccion_torneo(poblacion, aptitudes, tamano_torneo=3, rng=rng, salida=nueva)
+        aplicar_cruce_poblacion(
+            nueva, probabilidad_cruce, n_bits, rng=rng, salida=nueva
+        )
+        aplicar_mutacion_poblacion(
+            nueva, probabilidad_mutacion, n_bits, rng=rng, salida=nueva
+        )
+
+        # Elitismo: la élite pasa intacta a la siguiente generación
+        nueva[0] = elite_crom
+
+        actual, siguiente = siguiente, actual
+
+    # La población final (o la inicial, si generaciones == 0) aún no se ha
+    # evaluado: se compara con la élite antes de reportar el resultado.
+    poblacion = buferes[actual]
+    evaluar_poblacion(
+        poblacion, a_x, b_x, a_y, b_y, n_bits, salida=aptitudes, map_fn=map_fn
+    )
+    idx_mejor = int(aptitudes.argmax())
+    if aptitudes[idx_mejor] > elite_aptitud:
+        elite_crom = int(poblacion[idx_mejor])
+
+    mejor_cromosoma = elite_crom
+
+    mejor_x, mejor_y = decodificar_cromosoma(
+        mejor_cromosoma, a_x, b_x, a_y, b_y, n_bits
+    )
     mejor_f = f_objetivo(mejor_x, mejor_y)
 
     # Guardar CSV si se solicitó
     if ruta_csv is not None:
-        with open(ruta_csv, mode="w", newline="", encoding="utf-8") as f:
-            escritor = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "generacion",
-                    "mejor_aptitud",
-                    "aptitud_promedio",
-                    "mejor_x",
-                    "mejor_y",
-                    "f_mejor",
-                ],
-            )
-            escritor.writeheader()
-            escritor.writerows(historial)
+        np.savetxt(
+            ruta_csv,
+            historial,
+            fmt=["%d"] + ["%.17g"] * (len(HISTORIAL_DTYPE.names) - 1),
+            delimiter=",",
+            header=",".join(HISTORIAL_DTYPE.names),
+            comments="",
+            encoding="utf-8",
+        )
+
+    return mejor_cromosoma, mejor_x, mejor_y, mejor_f
+
+
+# -----------------------------------------------------------------------------
+# 9. Alternativa: algoritmo genético compacto (cGA)
+#
+# En lugar de almacenar una población explícita, el AG compacto mantiene un
+# vector de probabilidades p de longitud 2*n_bits, donde p[i] es la
+# probabilidad de que el bit i valga 1 en la población "virtual".
+#
+# En cada iteración:
+#    1) Se muestrean dos cromosomas a partir de p.
+#    2) Se comparan sus aptitudes (ganador / perdedor).
+#    3) En los bits donde difieren, p se desplaza 1/tamano_virtual hacia el
+#       valor del ganador.
+#
+# El proceso termina cuando p converge (todos sus valores son 0 o 1) o al
+# agotar las iteraciones. La memoria y el trabajo por iteración son O(2*n_bits)
+# en vez de O(tamano_poblacion * 2*n_bits).
+# -----------------------------------------------------------------------------
+def algoritmo_genetico_compacto(
+    generaciones: int = 5000,
+    n_bits: int = 10,
+    a_x: float = -5.12,
+    b_x: float = 5.12,
+    a_y: float = -5.12,
+    b_y: float = 5.12,
+    tamano_virtual: int = 30,
+    semilla: int | None = None,
+) -> tuple[int, float, float, float]:
+    """
+    Ejecuta un algoritmo genético compacto (cGA) sobre la misma función
+    objetivo y codificación que `algoritmo_genetico`.
+
+    Parámetros:
+        generaciones (int):
+            Número máximo de iteraciones (cada una compara dos individuos).
+        n_bits (int):
+            Número de bits asignados a cada variable del cromosoma.
+        a_x, b_x (float):
+            Límites inferior y superior para la variable x.
+        a_y, b_y (float):
+            Límites inferior y superior para la variable y.
+        tamano_virtual (int):
+            Tamaño de la población simulada; fija el paso 1/tamano_virtual
+            con el que se actualiza el vector de probabilidades.
+        semilla (int | None):
+            Semilla del generador aleatorio.
+
+    Retorna:
+        (mejor_cromosoma, mejor_x, mejor_y, mejor_f), con el mismo formato que
+        `algoritmo_genetico`, correspondiente al mejor individuo muestreado.
+    """
+    rng = np.random.default_rng(semilla)
+    n = 2 * n_bits
+    pesos = pesos_binarios(n)
+    paso = 1.0 / tamano_virtual
+
+    p = np.full(n, 0.5)
+    mejor_cromosoma, mejor_aptitud = 0, -np.inf
+
+    for _ in range(generaciones):
+        # Dos individuos muestreados de p, empaquetados como en la población
+        bits = rng.random((2, n)) < p
+        pareja = (bits @ pesos).astype(np.uint32)
+        aptitudes = evaluar_poblacion(pareja, a_x, b_x, a_y, b_y, n_bits)
+
+        ganador, perdedor = (0, 1) if aptitudes[0] >= aptitudes[1] else (1, 0)
+        if aptitudes[ganador] > mejor_aptitud:
+            mejor_cromosoma = int(pareja[ganador])
+            mejor_aptitud = aptitudes[ganador]
+
+        # Sólo cambian los bits donde ganador y perdedor difieren
+        p += (bits[ganador].astype(float) - bits[perdedor]) * paso
+        np.clip(p, 0.0, 1.0, out=p)
+
+        # Convergencia: cada p[i] está a menos de medio paso de 0 o de 1
+        if np.all(np.minimum(p, 1.0 - p) < 0.5 * paso):
+            break
+
+    mejor_x, mejor_y = decodificar_cromosoma(
+        mejor_cromosoma, a_x, b_x, a_y, b_y, n_bits
+    )
+    mejor_f = f_objetivo(mejor_x, mejor_y)
 
     return mejor_cromosoma, mejor_x, mejor_y, mejor_f
 
 
 def main():
-    mejor_crom, x_opt, y_opt, f_opt = algoritmo_genetico()
+    mejor_crom, x_opt, y_opt, f_opt = algoritmo_genetico(verbose=True)
 
     print("-------------------------------------------------------------")
     print("RESULTADOS DEL ALGORITMO GENÉTICO")
@@ -371,7 +722,7 @@ def main():
     print(f"Valor mínimo encontrado de f(x, y): {f_opt:.6f}")
     print()
     print("Cromosoma binario asociado al mínimo:")
-    print(mejor_crom)
+    print(desempaquetar(mejor_crom))
     print("-------------------------------------------------------------")
 
 
@@ -1,17 +1,15 @@
-import csv
-
 import matplotlib.pyplot as plt
+import numpy as np
 
-generaciones = []
-mejor_aptitud = []
-aptitud_promedio = []
-
-with open("./algoritmo_genetico_historial.csv", newline="", encoding="utf-8") as f:
-    lector = csv.DictReader(f)
-    for fila in lector:
-        generaciones.append(int(fila["generacion"]))
-        mejor_aptitud.append(float(fila["mejor_aptitud"]))
-        aptitud_promedio.append(float(fila["aptitud_promedio"]))
+# Columnas: generacion, mejor_aptitud, aptitud_promedio (se omite el encabezado)
+generaciones, mejor_aptitud, aptitud_promedio = np.loadtxt(
+    "./algoritmo_genetico_historial.csv",
+    delimiter=",",
+    skiprows=1,
+    usecols=(0, 1, 2),
+    unpack=True,
+    encoding="utf-8",
+)
 
 plt.plot(generaciones, mejor_aptitud, label="Mejor aptitud")
 plt.plot(generaciones, aptitud_promedio, label="Aptitud promedio")
@@ -15,7 +15,16 @@
 #
 # Licencia: MIT
 # -----------------------------------------------------------------------------
-import random
+import functools
+import importlib.util
+from collections.abc import Callable
+
+import numpy as np
+
+# Numba es opcional: sin él se usa la versión de NumPy. Se importa sólo cuando
+# hace falta (ver `_volumen_kernel`), ya que cargarlo tarda más que una corrida
+# completa con las poblaciones pequeñas del problema.
+NUMBA_DISPONIBLE = importlib.util.find_spec("numba") is not None
 
 
 # -----------------------------------------------------------------------------
@@ -30,6 +39,25 @@ import random
 #
 # Lo que da un total de 30 bits por individuo.
 # -----------------------------------------------------------------------------
+@functools.cache
+def pesos_binarios(n_bits: int) -> np.ndarray:
+    """
+    Potencias de dos [2^(n_bits-1), ..., 2, 1] para decodificar por producto
+    punto. Se calculan una sola vez por longitud y se reutilizan.
+
+    Se usa el entero sin signo más pequeño que contiene 2^n_bits - 1: el
+    producto nunca desborda y, con cromosomas uint8, es más rápido que int64.
+    """
+    tipo = np.min_scalar_type((1 << n_bits) - 1)
+    pesos = (1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64)).astype(tipo)
+    pesos.flags.writeable = False
+    return pesos
+
+
+# Constantes para el caso de 10 bits por variable, usado en todo el módulo
+MAX_INT_10 = (1 << 10) - 1
+
+
 def codificar(x: float, a: float, b: float, bits: int = 10) -> list[int]:
     if a >= b:
         raise ValueError("El límite inferior debe ser menor que el límite superior.")
@@ -48,21 +76,50 @@ def codificar(x: float, a: float, b: float, bits: int = 10) -> list[int]:
     return n_bits
 
 
-def decodificar(bits: list[int], a: float, b: float) -> float:
+def decodificar(bits: np.ndarray | list[int], a: float, b: float) -> float | np.ndarray:
     if a >= b:
         raise ValueError("El límite inferior debe ser menor que el límite superior.")
 
-    n_bits = len(bits)
+    # Admite también listas de bits, como las que devuelve `codificar`
+    bits = np.asarray(bits)
+    n_bits = bits.shape[-1]
+
+    # Un solo cromosoma de 10 bits: versión especializada sin producto punto
+    if bits.ndim == 1 and n_bits == 10:
+        return decodificar10(bits.tolist(), a, b)
+
     max_int = (1 << n_bits) - 1
 
-    k = 0
-    for bit in bits:
-        k = (k << 1) | (bit & 1)
+    # Producto con las potencias de dos: admite un cromosoma (1D) o un
+    # bloque de cromosomas (2D) y decodifica cada fila.
+    k = bits @ pesos_binarios(n_bits)
 
-    x = a + (k / max_int) * (b - a)
+    x = a + k * ((b - a) / max_int)
     return x
 
 
+def decodificar10(bits: list[int], a: float, b: float) -> float:
+    """
+    Versión de `decodificar` especializada para exactamente 10 bits, con los
+    desplazamientos desenrollados. No valida los límites.
+    """
+    d0, d1, d2, d3, d4, d5, d6, d7, d8, d9 = bits
+    k = (
+        (d0 << 9)
+        | (d1 << 8)
+        | (d2 << 7)
+        | (d3 << 6)
+        | (d4 << 5)
+        | (d5 << 4)
+        | (d6 << 3)
+        | (d7 << 2)
+        | (d8 << 1)
+        | d9
+    )
+    # Misma expresión que la ruta vectorizada, para obtener valores idénticos
+    return a + k * ((b - a) / MAX_INT_10)
+
+
 # -----------------------------------------------------------------------------
 # 3. Generación de la población inicial
 #
@@ -74,18 +131,32 @@ def decodificar(bits: list[int], a: float, b: float) -> float:
 #
 #    - 10 bits por variable
 #    - 3 variables (l, w, h)
+#
+# La población se guarda como un arreglo uint8 de forma (tamano, total_bits),
+# un cromosoma por fila.
+#
+# Las funciones aleatorias reciben un generador `rng` (np.random.Generator);
+# si se omite se crea uno nuevo sin semilla.
 # -----------------------------------------------------------------------------
-def cromosoma_aleatorio(bits_por_var: int = 10, num_variables: int = 3) -> list[int]:
+def cromosoma_aleatorio(
+    bits_por_var: int = 10,
+    num_variables: int = 3,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    rng = np.random.default_rng(rng)
     total_bits = bits_por_var * num_variables
-    return [random.randint(0, 1) for _ in range(total_bits)]
+    return rng.integers(0, 2, size=total_bits, dtype=np.uint8)
 
 
 def poblacion_inicial(
     tamano: int,
     bits_por_var: int = 10,
     num_variables: int = 3,
-) -> list[list[int]]:
-    return [cromosoma_aleatorio(bits_por_var, num_variables) for _ in range(tamano)]
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    rng = np.random.default_rng(rng)
+    total_bits = bits_por_var * num_variables
+    return rng.integers(0, 2, size=(tamano, total_bits), dtype=np.uint8)
 
 
 # -----------------------------------------------------------------------------
@@ -111,9 +182,14 @@ RANGOS = [
     (H_MIN, H_MAX),  # rango para h
 ]
 
+# Los mismos rangos en forma de arreglo, para decodificar la población completa
+RANGOS_A = np.array([a for a, _ in RANGOS])
+RANGOS_B = np.array([b for _, b in RANGOS])
+RANGE_SPAN = RANGOS_B - RANGOS_A
+
 
 def decodificar_individuo(
-    cromosoma: list[int],
+    cromosoma: np.ndarray | list[int],
     rangos: list[tuple[float, float]] = RANGOS,
     bits_por_var: int = 10,
 ) -> tuple[float, float, float]:
@@ -121,31 +197,56 @@ def decodificar_individuo(
     Convierte un cromosoma binario completo en las tres variables reales (l, w, h).
 
     Parámetros:
-        cromosoma  : lista de bits que representa al individuo
+        cromosoma  : arreglo de bits que representa al individuo; si es 2D
+                     (un cromosoma por fila) se decodifica toda la población
         rangos     : lista de tuplas (a, b) con el rango de cada variable
         bits_por_var : número de bits asignados a cada variable
 
     Devuelve:
-        Una tupla (l, w, h) con las dimensiones decodificadas.
+        Una tupla (l, w, h) con las dimensiones decodificadas (escalares o
+        arreglos con un valor por individuo).
     """
+    cromosoma = np.asarray(cromosoma)
     num_vars = len(rangos)
     esperado = num_vars * bits_por_var
+    longitud = cromosoma.shape[-1]
 
-    if len(cromosoma) != esperado:
+    if longitud != esperado:
         raise ValueError(
-            f"La longitud del cromosoma ({len(cromosoma)}) no coincide con "
+            f"La longitud del cromosoma ({longitud}) no coincide con "
             f"num_vars * bits_por_var = {esperado}."
         )
 
-    valores: list[float] = []
-    for i, (a, b) in enumerate(rangos):
-        inicio = i * bits_por_var
-        fin = (i + 1) * bits_por_var
-        sub_bits = cromosoma[inicio:fin]
-        x = decodificar(sub_bits, a, b)
-        valores.append(x)
-
-    length, width, height = valores
+    # Un solo cromosoma: cada variable por separado (ruta escalar de `decodificar`)
+    if cromosoma.ndim == 1:
+        valores = []
+        for i, (a, b) in enumerate(rangos):
+            inicio = i * bits_por_var
+            fin = (i + 1) * bits_por_var
+            sub_bits = cromosoma[inicio:fin]
+            x = decodificar(sub_bits, a, b)
+            valores.append(x)
+
+        length, width, height = valores
+        return length, width, height
+
+    # Población completa: (N, num_vars, bits_por_var) @ pesos -> (N, num_vars)
+    if rangos is RANGOS:
+        inferiores, amplitudes = RANGOS_A, RANGE_SPAN
+    else:
+        inferiores = np.array([a for a, _ in rangos])
+        amplitudes = np.array([b for _, b in rangos]) - inferiores
+        if np.any(amplitudes <= 0.0):
+            raise ValueError(
+                "El límite inferior debe ser menor que el límite superior."
+            )
+
+    bloques = cromosoma.reshape(*cromosoma.shape[:-1], num_vars, bits_por_var)
+    ks = bloques @ pesos_binarios(bits_por_var)
+    max_int = (1 << bits_por_var) - 1
+    valores = inferiores + ks * (amplitudes / max_int)
+
+    length, width, height = np.moveaxis(valores, -1, 0)
     return length, width, height
 
 
@@ -153,13 +254,43 @@ def volumen_caja(length: float, width: float, height: float) -> float:
     return length * width * height
 
 
-def aptitud(cromosoma: list[int]) -> float:
+def aptitud(cromosoma: np.ndarray) -> float | np.ndarray:
     length, width, height = decodificar_individuo(cromosoma)
     return volumen_caja(length, width, height)
 
 
-def evaluar_poblacion(poblacion: list[list[int]]) -> list[float]:
-    return [aptitud(individuo) for individuo in poblacion]
+# Por debajo de este tamaño de población (p. ej. los dos hijos que se evalúan
+# en cada generación) la versión de NumPy es más rápida que la de Numba.
+UMBRAL_JIT = 10_000
+
+
+@functools.cache
+def _volumen_kernel() -> Callable:
+    # Importa Numba y compila el kernel la primera vez que se necesita.
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(length, width, height, salida):
+        # Compilado a código nativo: escribe V(l_i, w_i, h_i) en `salida`.
+        for i in prange(length.size):
+            salida[i] = length[i] * width[i] * height[i]
+
+    return kernel
+
+
+def evaluar_poblacion(
+    poblacion: np.ndarray, salida: np.ndarray | None = None
+) -> np.ndarray:
+    # `salida` permite reutilizar el mismo arreglo de aptitudes entre generaciones.
+    if salida is None:
+        salida = np.empty(len(poblacion))
+
+    if NUMBA_DISPONIBLE and len(poblacion) >= UMBRAL_JIT:
+        length, width, height = decodificar_individuo(poblacion)
+        _volumen_kernel()(length, width, height, salida)
+    else:
+        salida[:] = aptitud(poblacion)
+    return salida
 
 
 # -----------------------------------------------------------------------------
@@ -174,20 +305,20 @@ def evaluar_poblacion(poblacion: list[list[int]]) -> list[float]:
 #      f_i  = aptitud del individuo i
 #      p_i  = probabilidad de selección del individuo i
 # -----------------------------------------------------------------------------
-def probabilidades_seleccion(aptitudes: list[float]) -> list[float]:
-    if not aptitudes:
+def probabilidades_seleccion(aptitudes: np.ndarray) -> np.ndarray:
+    if len(aptitudes) == 0:
         raise ValueError("La lista de aptitudes no puede estar vacía.")
 
-    total_aptitud = sum(aptitudes)
+    total_aptitud = aptitudes.sum()
 
     if total_aptitud <= 0.0:
         n = len(aptitudes)
-        return [1.0 / n] * n
+        return np.full(n, 1.0 / n)
 
-    return [f_i / total_aptitud for f_i in aptitudes]
+    return aptitudes / total_aptitud
 
 
-def resumen_poblacion(poblacion: list[list[int]]) -> None:
+def resumen_poblacion(poblacion: np.ndarray) -> None:
     valores_aptitud = evaluar_poblacion(poblacion)
     probs = probabilidades_seleccion(valores_aptitud)
 
@@ -206,16 +337,16 @@ def resumen_poblacion(poblacion: list[list[int]]) -> None:
 # A partir de las probabilidades de selección p_i, elegimos a los dos
 # individuos con mayor probabilidad (según el enunciado).
 # -----------------------------------------------------------------------------
-def indices_mejores(probabilidades: list[float], k: int = 2) -> list[int]:
+def indices_mejores(probabilidades: np.ndarray, k: int = 2) -> np.ndarray:
     """
     Devuelve los índices de los k individuos con mayor probabilidad.
 
     Parámetros:
-        probabilidades : lista de probabilidades p_i (una por individuo)
+        probabilidades : arreglo de probabilidades p_i (una por individuo)
         k              : número de individuos a seleccionar (por defecto 2)
 
     Devuelve:
-        Lista con los k mejores individuos, ordenados de
+        Arreglo con los índices de los k mejores individuos, ordenados de
         mayor a menor probabilidad.
     """
     if k <= 0:
@@ -223,24 +354,46 @@ def indices_mejores(probabilidades: list[float], k: int = 2) -> list[int]:
     if k > len(probabilidades):
         raise ValueError("k no puede ser mayor que el tamaño de la población.")
 
-    orden = sorted(
-        range(len(probabilidades)),
-        key=lambda i: probabilidades[i],
-        reverse=True,
-    )
-    return orden[:k]
+    # Selección parcial O(N): sólo se ordenan los k elegidos.
+    negadas = -np.asarray(probabilidades)
+    mejores = np.argpartition(negadas, k - 1)[:k]
+    return mejores[np.argsort(negadas[mejores], kind="stable")]
+
+
+def indices_ruleta(
+    probabilidades: np.ndarray, k: int = 2, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """
+    Alternativa a `indices_mejores`: selección por ruleta (proporcional a la
+    aptitud), con reemplazo.
+
+    Parámetros:
+        probabilidades : arreglo de probabilidades p_i (una por individuo)
+        k              : número de individuos a seleccionar (por defecto 2)
+        rng            : generador aleatorio a utilizar
+
+    Devuelve:
+        Arreglo con los índices de los k individuos sorteados.
+    """
+    if k <= 0:
+        raise ValueError("k debe ser un entero positivo.")
+
+    rng = np.random.default_rng(rng)
+    acumulada = np.cumsum(probabilidades)
+    sorteos = rng.random(k) * acumulada[-1]
+    return np.searchsorted(acumulada, sorteos, side="right")
 
 
 def seleccionar_mejores(
-    poblacion: list[list[int]],
-    probabilidades: list[float],
+    poblacion: np.ndarray,
+    probabilidades: np.ndarray,
     k: int = 2,
-) -> list[list[int]]:
+) -> np.ndarray:
     """
     Selecciona los k mejores individuos de la población según sus probabilidades.
     """
     idx = indices_mejores(probabilidades, k)
-    return [poblacion[i] for i in idx]
+    return poblacion[idx]
 
 
 # -----------------------------------------------------------------------------
@@ -248,19 +401,31 @@ def seleccionar_mejores(
 #
 # Dado un par de padres (cromosomas binarios de igual longitud), elegimos
 # un punto de cruce y generamos dos hijos intercambiando los segmentos.
+#
+# El operador también acepta bloques de padres de forma (n_pares, n_bits):
+# cada fila de `padre1` se cruza con la fila correspondiente de `padre2`, con
+# un punto de cruce independiente por pareja.
 # -----------------------------------------------------------------------------
-def cruce_un_punto(padre1: list[int], padre2: list[int]) -> tuple[list[int], list[int]]:
-    if len(padre1) != len(padre2):
+def cruce_un_punto(
+    padre1: np.ndarray,
+    padre2: np.ndarray,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    if padre1.shape != padre2.shape:
         raise ValueError("Ambos padres deben tener la misma longitud.")
-    n_bits = len(padre1)
+    n_bits = padre1.shape[-1]
 
     if n_bits < 2:
-        return padre1[:], padre2[:]
+        return padre1.copy(), padre2.copy()
 
-    punto = random.randint(1, n_bits - 1)
+    rng = np.random.default_rng(rng)
+    puntos = rng.integers(1, n_bits, size=padre1.shape[:-1])
 
-    hijo1 = padre1[:punto] + padre2[punto:]
-    hijo2 = padre2[:punto] + padre1[punto:]
+    # mascara[..., j] es verdadero en los bits que cada hijo hereda de su
+    # propio padre (antes del punto de cruce).
+    mascara = np.arange(n_bits) < puntos[..., np.newaxis]
+    hijo1 = np.where(mascara, padre1, padre2)
+    hijo2 = np.where(mascara, padre2, padre1)
 
     return hijo1, hijo2
 
@@ -273,32 +438,36 @@ def cruce_un_punto(padre1: list[int], padre2: list[int]) -> tuple[list[int], lis
 #
 #    0 -> 1
 #    1 -> 0
+#
+# Todos los sorteos se hacen a la vez y los bits se invierten con un XOR.
 # -----------------------------------------------------------------------------
-def mutar_cromosoma(cromosoma: list[int], p_mut: float) -> list[int]:
+def mutar_cromosoma(
+    cromosoma: np.ndarray, p_mut: float, rng: np.random.Generator | None = None
+) -> np.ndarray:
     if not (0.0 <= p_mut <= 1.0):
         raise ValueError("p_mut debe estar en el intervalo [0, 1].")
 
-    nuevo = []
-    for bit in cromosoma:
-        if random.random() < p_mut:
-            nuevo.append(1 - bit)  # Invierte el bit
-        else:
-            nuevo.append(bit)
-    return nuevo
+    # Máscara de Bernoulli: un 1 en cada bit sorteado para invertirse
+    rng = np.random.default_rng(rng)
+    mascara = (rng.random(cromosoma.shape) < p_mut).view(np.uint8)
+    return cromosoma ^ mascara
 
 
 def generar_hijos_desde_mejores(
-    poblacion: list[list[int]], p_mut: float = 0.01
-) -> tuple[list[int], list[int]]:
+    poblacion: np.ndarray,
+    p_mut: float = 0.01,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(rng)
     aptitudes = evaluar_poblacion(poblacion)
     probs = probabilidades_seleccion(aptitudes)
     mejores = seleccionar_mejores(poblacion, probs, k=2)
     padre1, padre2 = mejores
 
-    hijo1, hijo2 = cruce_un_punto(padre1, padre2)
+    hijo1, hijo2 = cruce_un_punto(padre1, padre2, rng)
 
-    hijo1_mut = mutar_cromosoma(hijo1, p_mut)
-    hijo2_mut = mutar_cromosoma(hijo2, p_mut)
+    hijo1_mut = mutar_cromosoma(hijo1, p_mut, rng)
+    hijo2_mut = mutar_cromosoma(hijo2, p_mut, rng)
 
     return hijo1_mut, hijo2_mut
 
@@ -307,7 +476,7 @@ def generar_hijos_desde_mejores(
 # 9. Bucle evolutivo del Algoritmo Genético
 #
 # En cada generación se realiza:
-#   1) Evaluación de la población
+#   1) Evaluación de la población (tras la primera, sólo de los hijos nuevos)
 #   2) Cálculo de probabilidades de selección
 #   3) Selección de los dos mejores individuos
 #   4) Cruce de un punto
@@ -317,10 +486,11 @@ def generar_hijos_desde_mejores(
 
 
 def evolucionar(
-    poblacion: list[list[int]],
+    poblacion: np.ndarray,
     generaciones: int = 50,
     p_mut: float = 0.01,
-) -> list[list[int]]:
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
     """
     Ejecuta el ciclo evolutivo completo del algoritmo genético.
 
@@ -328,29 +498,34 @@ def evolucionar(
         poblacion    : población inicial
         generaciones : número de iteraciones
         p_mut        : probabilidad de mutación por bit
+        rng          : generador aleatorio compartido por todos los operadores
 
     Devuelve:
         La población final después de 'generaciones' iteraciones.
     """
+    rng = np.random.default_rng(rng)
+
+    # La población completa se evalúa una sola vez; en cada generación sólo
+    # cambian los dos individuos reemplazados y sólo ellos se reevalúan.
+    aptitudes = evaluar_poblacion(poblacion)
+
     for gen in range(generaciones):
-        aptitudes = evaluar_poblacion(poblacion)
         probs = probabilidades_seleccion(aptitudes)
 
         # Selección de los dos mejores padres
         mejores = seleccionar_mejores(poblacion, probs, k=2)
         padre1, padre2 = mejores
 
-        # Cruce y mutación
-        hijo1, hijo2 = cruce_un_punto(padre1, padre2)
-        hijo1 = mutar_cromosoma(hijo1, p_mut)
-        hijo2 = mutar_cromosoma(hijo2, p_mut)
+        # Cruce y mutación (ambos hijos como un bloque de 2 filas)
+        hijos = np.stack(cruce_un_punto(padre1, padre2, rng))
+        hijos = mutar_cromosoma(hijos, p_mut, rng)
 
         # Identificamos los dos peores individuos
-        peores = sorted(range(len(aptitudes)), key=lambda i: aptitudes[i])[:2]
+        peores = np.argpartition(aptitudes, 1)[:2]
 
         # Reemplazamos los dos peores por los hijos generados
-        poblacion[peores[0]] = hijo1
-        poblacion[peores[1]] = hijo2
+        poblacion[peores] = hijos
+        aptitudes[peores] = evaluar_poblacion(hijos)
 
         # (Opcional) imprimir progreso
         # print(f"Generación {gen+1}: mejor aptitud = {max(aptitudes):.2f}")
@@ -359,18 +534,18 @@ def evolucionar(
 
 
 def main():
-    seed = random.randint(0, 10000)
+    seed = int(np.random.default_rng().integers(0, 10001))
     print(f"Semilla aleatoria: {seed}")
-    random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # 1) Creamos la población inicial
-    pobl = poblacion_inicial(tamano=100)
+    pobl = poblacion_inicial(tamano=100, rng=rng)
 
     print("\nPoblación inicial:")
     resumen_poblacion(pobl)
 
     # 2) Ejecutamos el AG durante 50 generaciones
-    pobl_final = evolucionar(pobl, generaciones=50, p_mut=0.05)
+    pobl_final = evolucionar(pobl, generaciones=50, p_mut=0.05, rng=rng)
 
     # 3) Evaluamos la población final
     print("\nPoblación final después de 50 generaciones:")
@@ -378,9 +553,7 @@ def main():
 
     # 4) Obtenemos el mejor individuo final
     aptitudes_finales = evaluar_poblacion(pobl_final)
-    mejor_indice = max(
-        range(len(aptitudes_finales)), key=lambda i: aptitudes_finales[i]
-    )
+    mejor_indice = int(aptitudes_finales.argmax())
     mejor = pobl_final[mejor_indice]
 
     l, w, h = decodificar_individuo(mejor)
@@ -389,7 +562,7 @@ def main():
     print("\nMejor individuo encontrado:")
     print(f"  l = {l:.2f} cm, w = {w:.2f} cm, h = {h:.2f} cm")
     print(f"  Volumen = {fit:.2f} cm^3")
-    print(f"  Cromosoma: {mejor}")
+    print(f"  Cromosoma: {mejor.tolist()}")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 #
 # Contexto:
 #   Este módulo implementa operadores básicos sobre individuos representados
-#   en espacio real (listas de flotantes), en el contexto de una mezcla de
+#   en espacio real (vectores de flotantes), en el contexto de una mezcla de
 #   ingredientes para una barra nutricional.
 #
 #   Cada individuo está formado por 4 genes, que representan gramos de:
@@ -22,7 +22,40 @@
 # Autor:  Ángel Peñaflor, 2025
 # Licencia: MIT
 # -----------------------------------------------------------------------------
-import random
+import array
+import queue
+import sys
+import threading
+from collections.abc import Sequence
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_DISPONIBLE = True
+except ImportError:  # Numba es opcional: sin él se usa la versión de NumPy
+    NUMBA_DISPONIBLE = False
+
+try:
+    from numba import cuda
+    from numba.cuda.random import (
+        create_xoroshiro128p_states,
+        xoroshiro128p_normal_float32,
+        xoroshiro128p_uniform_float32,
+    )
+
+    CUDA_DISPONIBLE = cuda.is_available()
+except ImportError:  # La GPU es opcional: sin ella todo corre en la CPU
+    CUDA_DISPONIBLE = False
+
+try:
+    from ga_kernels import mutate as _mutate_aot
+    from ga_kernels import mutate_report as _mutate_report_aot
+
+    AOT_DISPONIBLE = True
+except ImportError:  # Kernels precompilados opcionales (ver compile_kernel.py)
+    AOT_DISPONIBLE = False
 
 # -----------------------------------------------------------------------------
 # 1. Límites de las variables (genes)
@@ -45,60 +78,98 @@ LIMITES = [
     (0.0, 20.0),  # azúcar
 ]
 
+# Los mismos límites como vectores, para operar sobre la población completa.
+# Se calculan una sola vez y son de solo lectura: el kernel de Numba los recibe
+# como argumentos y los trata como arreglos constantes.
+#
+# La población se guarda en float32 (DTYPE): los genes son gramos en [0, 100]
+# que se reportan con 3 decimales, y float32 da unos 7 dígitos significativos.
+# Con la mitad de bytes por gen se mueve la mitad de memoria por generación.
+DTYPE = np.float32
+LOW = np.array([minimo for minimo, _ in LIMITES], dtype=DTYPE)
+HIGH = np.array([maximo for _, maximo in LIMITES], dtype=DTYPE)
+LOW.flags.writeable = False
+HIGH.flags.writeable = False
+
 
 # -----------------------------------------------------------------------------
 # 2. Generación de individuos y población inicial (representación real)
 #
-# En este módulo los individuos se representan como listas de números reales
-# (float), donde cada posición corresponde a la cantidad (en gramos) de un
-# ingrediente específico.
+# En este módulo un individuo suelto se representa como un `array.array("d")`
+# de números reales (float de 8 bytes contiguos, sin objetos float de Python
+# por elemento), donde cada posición corresponde a la cantidad (en gramos) de
+# un ingrediente específico.
 #
 #   individuo = [suero, avena, mantequilla_almendra, azucar]
 #
 # La función `individuo_aleatorio` genera un solo individuo muestreando
 # uniformemente dentro de los límites de cada ingrediente.
 #
-# La función `poblacion_inicial_real` construye una lista de individuos
-# independientes, que servirá como población inicial para un algoritmo genético
-# basado en variables reales.
+# La función `poblacion_inicial_real` construye la población completa,
+# muestreando todos los genes en una sola llamada vectorizada. Servirá como
+# población inicial para un algoritmo genético basado en variables reales.
+#
+# La población se guarda por genes (estructura de arreglos): un arreglo de
+# forma (4, tamano) donde cada fila contiene un ingrediente para todos los
+# individuos y la columna i es el individuo i. Cada gen queda contiguo en
+# memoria, con un solo par de límites escalares, y se puede desempaquetar en
+# cuatro vistas 1D sin copia:
+#
+#   suero, avena, mantequilla_almendra, azucar = poblacion
+#
+# Todas las funciones aleatorias reciben un generador `rng` (np.random.Generator);
+# si se omite se crea uno nuevo sin semilla.
 # -----------------------------------------------------------------------------
-def individuo_aleatorio() -> list[float]:
+def individuo_aleatorio(rng: np.random.Generator | None = None) -> array.array:
     """
     Genera un individuo aleatorio respetando los límites de cada ingrediente.
 
+    Parámetros:
+        rng (np.random.Generator | None):
+            Generador de números aleatorios; si es None se crea uno nuevo.
+
     Retorna:
-        list[float]: Lista con 4 valores en gramos, en el siguiente orden:
+        array.array: Arreglo "d" con 4 valores en gramos, en el siguiente orden:
             [proteína de suero, avena, mantequilla de almendra, azúcar]
     """
-    return [
-        random.uniform(10, 50),  # proteína de suero
-        random.uniform(20, 100),  # avena
-        random.uniform(5, 30),  # mantequilla de almendra
-        random.uniform(0, 20),  # azúcar
-    ]
+    rng = np.random.default_rng(rng)
+    return array.array("d", rng.uniform(LOW, HIGH).tobytes())
 
 
-def poblacion_inicial_real(tamano: int) -> list[list[float]]:
+def poblacion_inicial_real(
+    tamano: int, rng: np.random.Generator | None = None
+) -> np.ndarray:
     """
     Genera una población inicial de individuos en espacio real.
 
     Parámetros:
         tamano (int):
             Número de individuos a generar.
+        rng (np.random.Generator | None):
+            Generador de números aleatorios; si es None se crea uno nuevo.
 
     Retorna:
-        list[list[float]]: Lista de individuos. Cada individuo es una lista de
-        4 valores flotantes que representan gramos de los ingredientes.
+        np.ndarray: Arreglo float32 de forma (4, tamano). Cada fila es un
+        ingrediente y cada columna un individuo, dentro de sus límites.
     """
-    return [individuo_aleatorio() for _ in range(tamano)]
+    rng = np.random.default_rng(rng)
+    poblacion = rng.random((len(LIMITES), tamano), dtype=DTYPE)
+    poblacion *= (HIGH - LOW)[:, None]
+    poblacion += LOW[:, None]
+    return poblacion
 
 
 # -----------------------------------------------------------------------------
 # 3. Función auxiliar de recorte
 #
 # La función `recortar` garantiza que un valor permanezca dentro de un
-# intervalo [minimo, maximo]. Se utiliza después de aplicar la mutación
-# gaussiana para asegurar que los genes sigan siendo válidos.
+# intervalo [minimo, maximo].
+#
+# Después de la mutación gaussiana solo se recortan los genes que mutaron: la
+# versión de NumPy aplica un único `np.clip` a las k posiciones sorteadas, con
+# los límites `LOW[j]` y `HIGH[j]` de cada una, y los kernels compilados
+# recortan cada gen en línea con min/max. `recortar` se conserva para valores
+# escalares sueltos y ya no forma parte del ciclo de mutación.
 # -----------------------------------------------------------------------------
 def recortar(valor: float, minimo: float, maximo: float) -> float:
     """
@@ -121,54 +192,354 @@ def recortar(valor: float, minimo: float, maximo: float) -> float:
 # -----------------------------------------------------------------------------
 # 4. Operador de mutación gaussiana para individuos reales
 #
-# La función `mutar_individuo_real` implementa un operador de mutación
-# en espacio real. Para cada gen del individuo:
+# La función `mutar_poblacion` implementa un operador de mutación en espacio
+# real sobre la población completa. Para cada gen de cada individuo:
 #
 #   - Con probabilidad `probabilidad_mutacion` se le suma una perturbación
 #     gaussiana N(0, sigma).
 #   - Posteriormente, el valor resultante se recorta al intervalo permitido
-#     para ese gen usando `LIMITES`.
+#     para ese gen usando `LOW` y `HIGH`.
 #
 # Si la mutación no se aplica (según la probabilidad), el valor original
-# del gen se copia sin cambios.
+# del gen se conserva sin cambios.
+#
+# En lugar de una prueba de Bernoulli por gen, se sortea cuántos genes mutan,
+# k ~ Binomial(4N, probabilidad_mutacion), y se eligen k posiciones distintas
+# al azar: es la misma distribución, pero con probabilidad 0.1 se generan unos
+# 0.4N números aleatorios en vez de 4N. El ruido y el recorte se aplican solo a
+# esas posiciones. La población se modifica in-place.
+#
+# Si Numba está disponible, la mutación y el recorte se compilan a código
+# nativo: una pasada por gen, repartida entre hilos por individuo
+# (`_mutate_kernel`). En ese caso los números aleatorios provienen del generador
+# interno de Numba, con un flujo independiente por hilo, y no son
+# reproducibles. Por eso los kernels solo se usan cuando no se indica `rng`: con
+# un generador explícito se sigue la versión de NumPy y una misma semilla
+# reproduce exactamente la mutación.
 #
-# Nota: La función retorna un nuevo individuo, no modifica el original in-place.
+# Si existe el módulo `ga_kernels` (generado por `compile_kernel.py`), se usan
+# esos mismos kernels ya compilados: no hay compilación al arrancar. La versión
+# precompilada corre en un solo hilo, así que con Numba disponible solo se usa
+# por debajo de UMBRAL_JIT individuos, donde el arranque domina el costo. Solo
+# admite poblaciones float32 C-contiguas, que es lo que produce
+# `poblacion_inicial_real`.
+#
+# `mutar_poblacion_con_cambios` fusiona en una sola pasada la copia del estado
+# previo, la mutación y la detección de individuos cambiados, que es lo que
+# necesita el reporte de `ejecutar_mutaciones`.
+#
+# `mutar_individuo_real` se conserva por compatibilidad: muta una copia de un
+# solo individuo con el mismo operador y retorna un individuo nuevo, sin pasar
+# por listas de Python.
 # -----------------------------------------------------------------------------
+if NUMBA_DISPONIBLE:
+
+    @njit(fastmath=True, cache=True, inline="always")
+    def _mutar_gen(valor, probabilidad_mutacion, sigma, low_j, high_j):
+        # Un gen: prueba de Bernoulli, paso gaussiano y recorte sin ramas.
+        if np.random.random() < probabilidad_mutacion:
+            return min(max(valor + sigma * np.random.standard_normal(), low_j), high_j)
+        return valor
+
+    # Los kernels están especializados para los 4 genes del problema: el ciclo
+    # sobre genes se desenrolla en cuatro pasadas y los límites se cargan una
+    # vez como escalares. Cada gen es una fila contigua de la población, así
+    # que cada pasada recorre un solo flujo de memoria con paso unitario.
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mutate_kernel(poblacion, probabilidad_mutacion, sigma, low, high):
+        # Compilado a código nativo: muta y recorta `poblacion` in-place.
+        p, s, n = probabilidad_mutacion, sigma, poblacion.shape[1]
+        l0, l1, l2, l3 = low[0], low[1], low[2], low[3]
+        h0, h1, h2, h3 = high[0], high[1], high[2], high[3]
+        for i in prange(n):
+            poblacion[0, i] = _mutar_gen(poblacion[0, i], p, s, l0, h0)
+        for i in prange(n):
+            poblacion[1, i] = _mutar_gen(poblacion[1, i], p, s, l1, h1)
+        for i in prange(n):
+            poblacion[2, i] = _mutar_gen(poblacion[2, i], p, s, l2, h2)
+        for i in prange(n):
+            poblacion[3, i] = _mutar_gen(poblacion[3, i], p, s, l3, h3)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mutate_report_kernel(
+        poblacion, probabilidad_mutacion, sigma, low, high, anterior, cambiados
+    ):
+        # Las mismas cuatro pasadas; en cada una se copia el valor previo y se
+        # marca al individuo si algo cambió. Se compara lo ya guardado: en
+        # float32 un paso muy pequeño puede redondear de vuelta al valor
+        # original.
+        p, s, n = probabilidad_mutacion, sigma, poblacion.shape[1]
+        l0, l1, l2, l3 = low[0], low[1], low[2], low[3]
+        h0, h1, h2, h3 = high[0], high[1], high[2], high[3]
+        for i in prange(n):
+            cambiados[i] = False
+        for i in prange(n):
+            valor = anterior[0, i] = poblacion[0, i]
+            poblacion[0, i] = _mutar_gen(valor, p, s, l0, h0)
+            if poblacion[0, i] != valor:
+                cambiados[i] = True
+        for i in prange(n):
+            valor = anterior[1, i] = poblacion[1, i]
+            poblacion[1, i] = _mutar_gen(valor, p, s, l1, h1)
+            if poblacion[1, i] != valor:
+                cambiados[i] = True
+        for i in prange(n):
+            valor = anterior[2, i] = poblacion[2, i]
+            poblacion[2, i] = _mutar_gen(valor, p, s, l2, h2)
+            if poblacion[2, i] != valor:
+                cambiados[i] = True
+        for i in prange(n):
+            valor = anterior[3, i] = poblacion[3, i]
+            poblacion[3, i] = _mutar_gen(valor, p, s, l3, h3)
+            if poblacion[3, i] != valor:
+                cambiados[i] = True
+
+
+UMBRAL_JIT = 10_000
+
+
+def _validar_forma(poblacion: np.ndarray, *otros: np.ndarray) -> None:
+    # Los kernels compilados recorren las filas 0-3 sin comprobar límites: con
+    # menos genes escribirían fuera del arreglo y con más no mutarían el resto.
+    forma = (len(LIMITES), poblacion.shape[-1])
+    if poblacion.shape != forma:
+        raise ValueError(
+            f"La población debe tener forma {forma}, no {poblacion.shape}."
+        )
+    for arreglo in otros:
+        if arreglo.shape != forma:
+            raise ValueError(
+                f"Los búferes deben tener forma {forma}, no {arreglo.shape}."
+            )
+
+
+def _admite_aot(poblacion: np.ndarray, *otros: np.ndarray) -> bool:
+    # Los kernels precompilados tienen firma fija: float32 de forma (4, N)
+    if not AOT_DISPONIBLE or poblacion.shape[0] != len(LIMITES):
+        return False
+    if NUMBA_DISPONIBLE and poblacion.shape[1] >= UMBRAL_JIT:
+        return False
+    return all(a.dtype == DTYPE and a.flags.c_contiguous for a in (poblacion, *otros))
+
+
+def mutar_poblacion(
+    poblacion: np.ndarray,
+    probabilidad_mutacion: float = 0.1,
+    sigma: float = 1.0,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Aplica mutación gaussiana, in-place, a una población en espacio real.
+
+    Parámetros:
+        poblacion (np.ndarray):
+            Arreglo de forma (4, N): una fila por gen, una columna por
+            individuo (gramos).
+        probabilidad_mutacion (float):
+            Probabilidad de mutar cada gen de manera independiente.
+        sigma (float):
+            Desviación estándar de la perturbación gaussiana N(0, sigma).
+        rng (np.random.Generator | None):
+            Generador de números aleatorios. Si se indica, se usa la versión
+            de NumPy con este generador (resultado reproducible); si es None,
+            se usan los kernels compilados cuando están disponibles.
+
+    Retorna:
+        np.ndarray: La misma población, ya mutada y recortada a los límites.
+    """
+    _validar_forma(poblacion)
+    if rng is None and _admite_aot(poblacion):
+        _mutate_aot(poblacion, probabilidad_mutacion, sigma, LOW, HIGH)
+        return poblacion
+    if rng is None and NUMBA_DISPONIBLE:
+        _mutate_kernel(poblacion, probabilidad_mutacion, sigma, LOW, HIGH)
+        return poblacion
+
+    rng = np.random.default_rng(rng)
+
+    # El número de genes mutados sigue una Binomial(4N, p): se sortea una vez y
+    # se eligen esas posiciones sin reemplazo, sin probar los 4N genes uno a uno
+    n_genes = poblacion.size
+    k = rng.binomial(n_genes, probabilidad_mutacion)
+    posiciones = rng.choice(n_genes, size=k, replace=False, shuffle=False)
+    j, i = np.divmod(posiciones, poblacion.shape[1])
+
+    valores = poblacion[j, i]
+    valores += sigma * rng.standard_normal(k, dtype=poblacion.dtype)
+    np.clip(valores, LOW[j], HIGH[j], out=valores)
+    poblacion[j, i] = valores
+    return poblacion
+
+
+def mutar_poblacion_con_cambios(
+    poblacion: np.ndarray,
+    probabilidad_mutacion: float,
+    sigma: float,
+    anterior: np.ndarray,
+    cambiados: np.ndarray,
+    rng: np.random.Generator | None = None,
+) -> None:
+    """
+    Igual que `mutar_poblacion`, pero además registra qué individuos cambiaron.
+
+    Parámetros:
+        poblacion (np.ndarray):
+            Arreglo de forma (4, N), una columna por individuo; se muta
+            in-place.
+        probabilidad_mutacion (float):
+            Probabilidad de mutar cada gen de manera independiente.
+        sigma (float):
+            Desviación estándar de la perturbación gaussiana N(0, sigma).
+        anterior (np.ndarray):
+            Búfer de forma (4, N) donde se escribe la población previa.
+        cambiados (np.ndarray):
+            Búfer booleano de forma (N,); se marca True en cada individuo con al
+            menos un gen distinto tras la mutación.
+        rng (np.random.Generator | None):
+            Generador de números aleatorios. Si se indica, se usa la versión
+            de NumPy con este generador (resultado reproducible); si es None,
+            se usan los kernels compilados cuando están disponibles.
+    """
+    _validar_forma(poblacion, anterior)
+    if cambiados.shape != poblacion.shape[1:]:
+        raise ValueError(
+            f"`cambiados` debe tener forma {poblacion.shape[1:]}, "
+            f"no {cambiados.shape}."
+        )
+    if rng is None and _admite_aot(poblacion, anterior):
+        _mutate_report_aot(
+            poblacion, probabilidad_mutacion, sigma, LOW, HIGH, anterior, cambiados
+        )
+        return
+    if rng is None and NUMBA_DISPONIBLE:
+        _mutate_report_kernel(
+            poblacion, probabilidad_mutacion, sigma, LOW, HIGH, anterior, cambiados
+        )
+        return
+
+    np.copyto(anterior, poblacion)
+    mutar_poblacion(poblacion, probabilidad_mutacion, sigma, rng)
+    np.any(anterior != poblacion, axis=0, out=cambiados)
+
+
 def mutar_individuo_real(
-    individuo: list[float],
+    individuo: Sequence[float],
     probabilidad_mutacion: float = 0.1,
     sigma: float = 1.0,
-) -> list[float]:
+    rng: np.random.Generator | None = None,
+) -> array.array:
     """
     Aplica mutación gaussiana a un individuo representado en espacio real.
 
     Parámetros:
-        individuo (list[float]):
-            Individuo original, una lista de valores reales (gramos).
+        individuo (Sequence[float]):
+            Individuo original: un `array.array("d")` o cualquier secuencia de
+            valores reales (gramos), con un valor por ingrediente.
         probabilidad_mutacion (float):
             Probabilidad de mutar cada gen de manera independiente.
         sigma (float):
             Desviación estándar de la perturbación gaussiana N(0, sigma).
+        rng (np.random.Generator | None):
+            Generador de números aleatorios; si es None se crea uno nuevo.
 
     Retorna:
-        list[float]: Nuevo individuo mutado (copia del original con posibles
+        array.array: Nuevo individuo mutado (copia del original con posibles
         modificaciones en algunos genes).
     """
-    nuevo: list[float] = []
+    nuevo = array.array("d", individuo)
+    if len(nuevo) != len(LIMITES):
+        raise ValueError(
+            f"El individuo debe tener {len(LIMITES)} genes, no {len(nuevo)}."
+        )
+    # Vista sin copia sobre el búfer de `nuevo`: la mutación escribe en él
+    mutar_poblacion(
+        np.frombuffer(nuevo).reshape(-1, 1), probabilidad_mutacion, sigma, rng
+    )
+    return nuevo
 
-    for i, valor in enumerate(individuo):
-        if random.random() < probabilidad_mutacion:
-            perturbacion = random.gauss(0, sigma)
-            valor_mutado = valor + perturbacion
-            minimo, maximo = LIMITES[i]
-            valor_mutado = recortar(valor_mutado, minimo, maximo)
 
-            nuevo.append(valor_mutado)
-        else:
-            # Sin mutación: se copia el valor original
-            nuevo.append(valor)
+# -----------------------------------------------------------------------------
+# 4.1. Mutación en GPU (CUDA)
+#
+# El operador es independiente por individuo, así que en la GPU se lanza un
+# hilo por individuo, cada uno con su propio estado xoroshiro128p. Con la
+# población guardada por genes, hilos consecutivos leen posiciones
+# consecutivas de cada gen y los accesos a memoria se agrupan. La población
+# se copia una sola vez al dispositivo, se muta ahí durante todas las
+# generaciones y se copia de vuelta al final.
+#
+# Solo compensa para poblaciones grandes (del orden de 10^4 individuos o más):
+# con menos, el costo de lanzar kernels y transferir datos domina.
+#
+# Nota: este kernel solo se ha verificado con el simulador de CUDA de Numba
+# (NUMBA_ENABLE_CUDASIM=1), no en una GPU real.
+# -----------------------------------------------------------------------------
+UMBRAL_GPU = 10_000
+
+if CUDA_DISPONIBLE:
+
+    @cuda.jit
+    def _mutate_gpu(poblacion, estados, probabilidad_mutacion, sigma, low, high):
+        i = cuda.grid(1)
+        if i >= poblacion.shape[1]:
+            return
+        # Los 4 genes del problema, fijos como en los kernels de CPU
+        for j in range(4):
+            if xoroshiro128p_uniform_float32(estados, i) < probabilidad_mutacion:
+                valor = poblacion[j, i] + sigma * xoroshiro128p_normal_float32(
+                    estados, i
+                )
+                poblacion[j, i] = min(max(valor, low[j]), high[j])
+
+
+def mutar_poblacion_gpu(
+    poblacion: np.ndarray,
+    generaciones: int,
+    probabilidad_mutacion: float = 0.1,
+    sigma: float = 1.0,
+    rng: np.random.Generator | None = None,
+    hilos_por_bloque: int = 256,
+) -> np.ndarray:
+    """
+    Aplica `generaciones` rondas de mutación gaussiana en la GPU, in-place.
 
-    return nuevo
+    Parámetros:
+        poblacion (np.ndarray):
+            Arreglo de forma (4, N): una fila por gen, una columna por
+            individuo (gramos).
+        generaciones (int):
+            Número de rondas de mutación a aplicar en el dispositivo.
+        probabilidad_mutacion (float):
+            Probabilidad de mutar cada gen de manera independiente.
+        sigma (float):
+            Desviación estándar de la perturbación gaussiana N(0, sigma).
+        rng (np.random.Generator | None):
+            Generador del que se toma la semilla de los estados de la GPU.
+        hilos_por_bloque (int):
+            Hilos por bloque CUDA.
+
+    Retorna:
+        np.ndarray: La misma población, ya mutada y recortada a los límites.
+    """
+    if not CUDA_DISPONIBLE:
+        raise RuntimeError("No hay una GPU con CUDA disponible.")
+    _validar_forma(poblacion)
+
+    rng = np.random.default_rng(rng)
+    n = poblacion.shape[1]
+    bloques = (n + hilos_por_bloque - 1) // hilos_por_bloque
+
+    d_poblacion = cuda.to_device(poblacion)
+    d_low, d_high = cuda.to_device(LOW), cuda.to_device(HIGH)
+    estados = create_xoroshiro128p_states(n, seed=int(rng.integers(2**63)))
+
+    for _ in range(generaciones):
+        _mutate_gpu[bloques, hilos_por_bloque](
+            d_poblacion, estados, probabilidad_mutacion, sigma, d_low, d_high
+        )
+
+    d_poblacion.copy_to_host(poblacion)
+    return poblacion
 
 
 # -----------------------------------------------------------------------------
@@ -179,27 +550,58 @@ def mutar_individuo_real(
 # mutación a lo largo de varias generaciones:
 #
 #     1) Se genera una población inicial de individuos reales.
-#     2) En cada generación, se muta cada individuo de la población.
+#     2) En cada generación, se muta la población completa de una vez.
 #     3) Si un individuo cambia (es decir, al menos un gen se modifica),
 #        se imprime en pantalla el estado "antes" y "después" de la mutación.
+#        Esto solo ocurre con `verbose=True`; en caso contrario el bucle se
+#        limita a mutar, lo que permite medir el costo del operador.
 #
 # Este procedimiento es útil para:
 #     - Verificar que la mutación está funcionando.
 #     - Visualizar los cambios en los genes respetando los límites.
 #     - Analizar el efecto de los parámetros `probabilidad_mutacion` y `sigma`.
 # -----------------------------------------------------------------------------
+# Plantilla del reporte de un individuo mutado: generación, índice y los cuatro
+# genes antes y después de la mutación.
+_TMPL = (
+    "Gen %02d, Ind %04d:\n"
+    "  Antes:\n"
+    "    Suero:                 %.3f g\n"
+    "    Avena:                 %.3f g\n"
+    "    Mantequilla Almendra:  %.3f g\n"
+    "    Azúcar:                %.3f g\n"
+    "  Después:\n"
+    "    Suero:                 %.3f g\n"
+    "    Avena:                 %.3f g\n"
+    "    Mantequilla Almendra:  %.3f g\n"
+    "    Azúcar:                %.3f g\n"
+    "\n"  # línea en blanco para separar individuos
+)
+
+
+def _escritor(cola: queue.Queue) -> None:
+    """
+    Escribe en stdout los bloques de texto de `cola` hasta recibir None.
+    """
+    while (texto := cola.get()) is not None:
+        sys.stdout.write(texto)
+    sys.stdout.flush()
+
+
 def ejecutar_mutaciones(
     generaciones: int = 50,
     tamano_poblacion: int = 1000,
     probabilidad_mutacion: float = 0.1,
     sigma: float = 1.0,
-) -> None:
+    semilla: int | None = None,
+    verbose: bool = False,
+) -> np.ndarray:
     """
     Ejecuta un experimento de mutación sobre varias generaciones.
 
     En cada generación, se aplica mutación gaussiana a todos los individuos
-    de la población. Si un individuo cambia, se imprimen sus valores antes
-    y después de la mutación.
+    de la población. Si `verbose` es True y un individuo cambia, se imprimen
+    sus valores antes y después de la mutación.
 
     Parámetros:
         generaciones (int):
@@ -211,47 +613,78 @@ def ejecutar_mutaciones(
         sigma (float):
             Desviación estándar de la perturbación gaussiana aplicada
             a cada gen que se muta.
+        semilla (int | None):
+            Semilla del generador aleatorio (PCG64) que comparten la población
+            inicial y la mutación: con la misma semilla se obtiene la misma
+            ejecución (la mutación corre en la versión de NumPy). Si es None,
+            cada ejecución es distinta y se usan los kernels compilados.
+        verbose (bool):
+            Si es True, imprime los individuos que cambian en cada generación.
+            Sin reporte, sin semilla y con al menos UMBRAL_GPU individuos, la
+            mutación se ejecuta en la GPU cuando hay una disponible.
+
+    Retorna:
+        np.ndarray: Población final, de forma (4, tamano_poblacion), una
+        columna por individuo.
     """
     # 1) Generar población inicial
-    poblacion = poblacion_inicial_real(tamano_poblacion)
-
-    # 2) Bucle de generaciones
-    for gen in range(1, generaciones + 1):
-        print(f"\n=== GENERACIÓN {gen} ===")
-
-        nueva_poblacion: list[list[float]] = []
-
-        for idx, ind in enumerate(poblacion):
-            original = ind
-            mutado = mutar_individuo_real(
-                original,
-                probabilidad_mutacion=probabilidad_mutacion,
-                sigma=sigma,
+    rng = np.random.default_rng(semilla)
+    poblacion = poblacion_inicial_real(tamano_poblacion, rng)
+
+    # Con semilla, la mutación usa el mismo generador (versión de NumPy) para
+    # que la ejecución sea reproducible, también en máquinas con GPU; sin ella,
+    # los kernels más rápidos
+    rng_mutacion = rng if semilla is not None else None
+
+    if not verbose:
+        # 2) Bucle de generaciones, sin reporte; en la GPU si conviene
+        if rng_mutacion is None and CUDA_DISPONIBLE and tamano_poblacion >= UMBRAL_GPU:
+            return mutar_poblacion_gpu(
+                poblacion, generaciones, probabilidad_mutacion, sigma, rng
+            )
+        for _ in range(generaciones):
+            mutar_poblacion(poblacion, probabilidad_mutacion, sigma, rng_mutacion)
+        return poblacion
+
+    # Estado previo a la mutación e individuos cambiados, reutilizados en cada
+    # generación
+    anterior = np.empty_like(poblacion)
+    cambiados = np.empty(tamano_poblacion, dtype=np.bool_)
+
+    # El texto se formatea aquí, pero la escritura en la terminal la hace un
+    # hilo aparte: la siguiente generación se calcula mientras se imprime
+    cola: queue.Queue = queue.Queue()
+    hilo = threading.Thread(target=_escritor, args=(cola,), daemon=True)
+    hilo.start()
+
+    try:
+        # 2) Bucle de generaciones
+        for gen in range(1, generaciones + 1):
+            # La población se muta in-place; en la misma pasada se guarda el
+            # estado previo y se marcan los individuos que cambiaron realmente
+            mutar_poblacion_con_cambios(
+                poblacion,
+                probabilidad_mutacion,
+                sigma,
+                anterior,
+                cambiados,
+                rng_mutacion,
             )
 
-            # Detectar si hubo un cambio real en algún gen (tolerancia numérica)
-            if any(abs(o - m) > 1e-9 for o, m in zip(original, mutado)):
-                print(f"Gen {gen:02d}, Ind {idx:04d}:")
-
-                print("  Antes:")
-                print(f"    Suero:                 {original[0]:.3f} g")
-                print(f"    Avena:                 {original[1]:.3f} g")
-                print(f"    Mantequilla Almendra:  {original[2]:.3f} g")
-                print(f"    Azúcar:                {original[3]:.3f} g")
-
-                print("  Después:")
-                print(f"    Suero:                 {mutado[0]:.3f} g")
-                print(f"    Avena:                 {mutado[1]:.3f} g")
-                print(f"    Mantequilla Almendra:  {mutado[2]:.3f} g")
-                print(f"    Azúcar:                {mutado[3]:.3f} g")
-
-                print()  # línea en blanco para separar individuos
-
-            nueva_poblacion.append(mutado)
+            # Un solo bloque de texto por generación
+            cola.put(
+                f"\n=== GENERACIÓN {gen} ===\n"
+                + "".join(
+                    _TMPL % (gen, idx, *anterior[:, idx], *poblacion[:, idx])
+                    for idx in np.flatnonzero(cambiados)
+                )
+            )
+    finally:
+        cola.put(None)
+        hilo.join()
 
-        # La nueva población se convierte en la población actual
-        poblacion = nueva_poblacion
+    return poblacion
 
 
 if __name__ == "__main__":
-    ejecutar_mutaciones()
+    ejecutar_mutaciones(verbose=True)
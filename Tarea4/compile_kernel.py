@@ -0,0 +1,50 @@
+# -----------------------------------------------------------------------------
+# Compilación anticipada (AOT) de los kernels de mutación de BarraDeProteina
+#
+# Los kernels de `BarraDeProteina.py` se compilan con Numba la primera vez que
+# se usan (JIT). Con `cache=True` el resultado se guarda en disco, pero una
+# ejecución en frío todavía paga la compilación.
+#
+# Este script compila esos mismos kernels con `numba.pycc` a un módulo de
+# extensión, `ga_kernels`, junto a este archivo. Si el módulo existe,
+# `BarraDeProteina.py` lo importa y lo usa directamente, sin compilar nada al
+# arrancar; además, el módulo compilado no necesita Numba para ejecutarse.
+#
+# Las firmas son fijas: población float32 de forma (4, N) C-contigua y límites
+# float32. La versión AOT se compila sin paralelismo (prange se comporta como
+# range).
+#
+# Uso:
+#     python Tarea4/compile_kernel.py
+#
+# Ángel Peñaflor, 2025
+#
+# Licencia: MIT
+# -----------------------------------------------------------------------------
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from numba.pycc import CC
+except ImportError:
+    sys.exit("Se necesita Numba para compilar los kernels.")
+
+import BarraDeProteina as bp
+
+cc = CC("ga_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.target_cpu = "host"  # instrucciones de la máquina local, como el JIT
+
+# Se reutiliza el código Python de los kernels JIT: una sola fuente para ambos
+cc.export("mutate", "void(f4[:, ::1], f8, f8, f4[::1], f4[::1])")(
+    bp._mutate_kernel.py_func
+)
+cc.export(
+    "mutate_report",
+    "void(f4[:, ::1], f8, f8, f4[::1], f4[::1], f4[:, ::1], b1[::1])",
+)(bp._mutate_report_kernel.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -36,6 +36,19 @@ echo "Instalando dependencias..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Precompilar los kernels de Tarea4 (opcional: sin ellos se compilan al vuelo).
+# Solo se recompilan si no existen o si BarraDeProteina.py es más reciente, para
+# no pagar la compilación en cada ejecución ni usar kernels desactualizados.
+KERNELS_SO=$(ls ./Tarea4/ga_kernels*.so 2>/dev/null | head -n 1)
+if [ -z "$KERNELS_SO" ] || [ ./Tarea4/BarraDeProteina.py -nt "$KERNELS_SO" ] \
+    || [ ./Tarea4/compile_kernel.py -nt "$KERNELS_SO" ]; then
+    echo "Compilando kernels de Tarea4/BarraDeProteina.py..."
+    rm -f ./Tarea4/ga_kernels*.so
+    python ./Tarea4/compile_kernel.py || echo "No se pudieron precompilar; se usará JIT."
+else
+    echo "Los kernels precompilados de Tarea4 están al día."
+fi
+
 # Ejecutar scripts
 echo "Ejecutando Tarea2/AlgoritmoGenetico.py..."
 python ./Tarea2/AlgoritmoGenetico.py > tarea1.log